@@ -9,8 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.const import CONF_TOKEN, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_TOKEN, EVENT_HOMEASSISTANT_CLOSE, Platform
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import NotionTodoApiClient
@@ -19,7 +18,7 @@ from .coordinator import NotionTodoDataUpdateCoordinator
 from .data import NotionTodoConfigEntry, NotionTodoData
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
 
 PLATFORMS: list[Platform] = [Platform.TODO]
 
@@ -36,11 +35,18 @@ async def async_setup_entry(
         update_interval=DEFAULT_SCAN_INTERVAL,
     )
     coordinator.config_entry = entry
+    client = NotionTodoApiClient(token=entry.data[CONF_TOKEN])
+    entry.async_on_unload(client.async_close)
+
+    async def _async_close_client(_event: Event) -> None:
+        """Close the client when Home Assistant stops without unloading entries."""
+        await client.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    )
     entry.runtime_data = NotionTodoData(
-        client=NotionTodoApiClient(
-            token=entry.data[CONF_TOKEN],
-            session=async_get_clientsession(hass),
-        ),
+        client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
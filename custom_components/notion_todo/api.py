@@ -3,21 +3,43 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import socket
-from http import HTTPStatus
-from typing import Any
+import time
+from functools import partial
+from http import HTTPMethod, HTTPStatus
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
+import orjson
+from aiohttp.hdrs import USER_AGENT
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from yarl import URL
 
 from .const import NOTION_VERSION
 
-NOTION_API_BASE = "https://api.notion.com/v1"
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+NOTION_API_URL = URL("https://api.notion.com/v1")
+SEARCH_URL = NOTION_API_URL / "search"
 AUTH_FAILURE_STATUSES = (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN)
 ERROR_INVALID_CREDENTIALS = "Invalid credentials"
 ERROR_INVALID_DATABASE_ID = "Invalid database id"
 ERROR_RESOURCE_NOT_FOUND = "Resource not found"
 ERROR_RATE_LIMIT = "Rate limit exceeded"
+ERROR_SERVER = "Server error"
 ERROR_UNEXPECTED_RESPONSE = "Unexpected response"
+MAX_ATTEMPTS = 4
+RETRY_BACKOFF_BASE = 0.5
+RETRY_JITTER = 0.25
+RETRY_MAX_DELAY = 30
+MAX_CONCURRENT_REQUESTS = 5
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+PAGE_SIZE = 100
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20, sock_connect=10, sock_read=20)
+DATABASE_CACHE_TTL = 120
 
 
 class NotionTodoApiClientError(Exception):
@@ -40,115 +62,209 @@ class NotionTodoApiClientRateLimitError(NotionTodoApiClientError):
     """Exception to indicate rate limiting."""
 
 
+STATUS_ERRORS: dict[int, Callable[[], NotionTodoApiClientError]] = {
+    **dict.fromkeys(
+        AUTH_FAILURE_STATUSES,
+        partial(NotionTodoApiClientAuthenticationError, ERROR_INVALID_CREDENTIALS),
+    ),
+    HTTPStatus.BAD_REQUEST: partial(
+        NotionTodoApiClientNotFoundError, ERROR_INVALID_DATABASE_ID
+    ),
+    HTTPStatus.NOT_FOUND: partial(
+        NotionTodoApiClientNotFoundError, ERROR_RESOURCE_NOT_FOUND
+    ),
+    HTTPStatus.TOO_MANY_REQUESTS: partial(
+        NotionTodoApiClientRateLimitError, ERROR_RATE_LIMIT
+    ),
+}
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """Return seconds to wait before retrying, honoring Retry-After."""
+    try:
+        delay = float(retry_after) if retry_after else None
+    except ValueError:
+        delay = None
+    if delay is None:
+        jitter = random.uniform(0, RETRY_JITTER)  # noqa: S311
+        delay = RETRY_BACKOFF_BASE * 2**attempt + jitter
+    return min(max(delay, 0), RETRY_MAX_DELAY)
+
+
+def _response_error(
+    response: aiohttp.ClientResponse, attempt: int
+) -> tuple[NotionTodoApiClientError | None, float | None]:
+    """Return the error for a failed response and the delay before a retry."""
+    status = response.status
+    error_factory = STATUS_ERRORS.get(status)
+    if error_factory is not None:
+        retry_delay = None
+        if status == HTTPStatus.TOO_MANY_REQUESTS:
+            retry_delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+        return error_factory(), retry_delay
+    if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        msg = f"{ERROR_SERVER} - {status}"
+        return NotionTodoApiClientCommunicationError(msg), _retry_delay(None, attempt)
+    return None, None
+
+
 class NotionTodoApiClient:
     """Notion API client."""
 
-    def __init__(self, token: str, session: aiohttp.ClientSession) -> None:
-        """Initialize the client."""
-        self._token = token
+    def __init__(
+        self, token: str, session: aiohttp.ClientSession | None = None
+    ) -> None:
+        """
+        Initialize the client.
+
+        Without a session, the client owns a dedicated session whose pooled
+        connections to the Notion API are kept alive between requests.
+        """
+        self._database_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._owns_session = session is None
+        if session is None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=MAX_CONCURRENT_REQUESTS,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    enable_cleanup_closed=True,
+                ),
+                headers={USER_AGENT: SERVER_SOFTWARE},
+                timeout=REQUEST_TIMEOUT,
+            )
         self._session = session
+        self._get_headers = {
+            "Authorization": f"Bearer {token}",
+            "Notion-Version": NOTION_VERSION,
+        }
+        self._post_headers = {
+            **self._get_headers,
+            "Content-Type": "application/json",
+        }
+
+    async def async_close(self) -> None:
+        """Close the session if it is owned by this client."""
+        if self._owns_session:
+            await self._session.close()
 
     async def async_get_database(self, database_id: str) -> dict[str, Any]:
-        """Fetch database metadata."""
-        return await self._api_wrapper(
-            method="get",
-            url=f"{NOTION_API_BASE}/databases/{database_id}",
+        """Fetch database metadata, reusing a recent response."""
+        cached = self._database_cache.get(database_id)
+        if cached and time.monotonic() - cached[0] < DATABASE_CACHE_TTL:
+            return cached[1]
+        database = await self._api_wrapper(
+            method=HTTPMethod.GET,
+            url=NOTION_API_URL / "databases" / database_id,
         )
+        self._database_cache[database_id] = (time.monotonic(), database)
+        return database
 
     async def async_query_data_source(
         self, data_source_id: str
     ) -> list[dict[str, Any]]:
         """Query all pages for a data source."""
-        results: list[dict[str, Any]] = []
-        payload: dict[str, Any] = {"page_size": 100}
-        next_cursor: str | None = None
-        while True:
-            if next_cursor:
-                payload["start_cursor"] = next_cursor
-            data = await self._api_wrapper(
-                method="post",
-                url=f"{NOTION_API_BASE}/data_sources/{data_source_id}/query",
-                data=payload,
-            )
-            results.extend(data.get("results", []))
-            if not data.get("has_more"):
-                break
-            next_cursor = data.get("next_cursor")
-        return results
+        return [
+            page async for page in self.async_iter_query_data_source(data_source_id)
+        ]
+
+    def async_iter_query_data_source(
+        self, data_source_id: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate all pages for a data source as each response arrives."""
+        return self._async_iter_results(
+            url=NOTION_API_URL / "data_sources" / data_source_id / "query",
+            payload={"page_size": PAGE_SIZE},
+        )
 
     async def async_search_databases(self) -> list[dict[str, Any]]:
         """Search for accessible databases."""
-        results: list[dict[str, Any]] = []
-        payload: dict[str, Any] = {
-            "page_size": 100,
-            "filter": {"property": "object", "value": "database"},
-        }
-        next_cursor: str | None = None
+        return [
+            item
+            async for item in self._async_iter_results(
+                url=SEARCH_URL,
+                payload={
+                    "page_size": PAGE_SIZE,
+                    "filter": {"property": "object", "value": "database"},
+                },
+            )
+        ]
+
+    async def _async_iter_results(
+        self, url: URL, payload: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield results from a paginated POST endpoint.
+
+        The next page is requested as soon as its cursor is known, so the
+        request is in flight while the current page is being consumed.
+        """
+        data = await self._api_wrapper(method=HTTPMethod.POST, url=url, data=payload)
         while True:
+            next_page: asyncio.Task[dict[str, Any]] | None = None
+            next_cursor = data.get("next_cursor") if data.get("has_more") else None
             if next_cursor:
-                payload["start_cursor"] = next_cursor
-            data = await self._api_wrapper(
-                method="post",
-                url=f"{NOTION_API_BASE}/search",
-                data=payload,
-            )
-            results.extend(data.get("results", []))
-            if not data.get("has_more"):
-                break
-            next_cursor = data.get("next_cursor")
-        return results
+                next_page = asyncio.create_task(
+                    self._api_wrapper(
+                        method=HTTPMethod.POST,
+                        url=url,
+                        data={**payload, "start_cursor": next_cursor},
+                    )
+                )
+            try:
+                for item in data.get("results", ()):
+                    yield item
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
+                return
+            data = await next_page
 
     async def _api_wrapper(
         self,
-        method: str,
-        url: str,
+        method: HTTPMethod,
+        url: URL,
         data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make an API request."""
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Notion-Version": NOTION_VERSION,
-        }
-        if method.lower() != "get":
-            headers["Content-Type"] = "application/json"
-        error: NotionTodoApiClientError | None = None
-        try:
-            async with asyncio.timeout(20):
-                async with self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
-                ) as response:
-                    if response.status in AUTH_FAILURE_STATUSES:
-                        error = NotionTodoApiClientAuthenticationError(
-                            ERROR_INVALID_CREDENTIALS
-                        )
-                    elif response.status == HTTPStatus.BAD_REQUEST:
-                        error = NotionTodoApiClientNotFoundError(
-                            ERROR_INVALID_DATABASE_ID
-                        )
-                    elif response.status == HTTPStatus.NOT_FOUND:
-                        error = NotionTodoApiClientNotFoundError(
-                            ERROR_RESOURCE_NOT_FOUND
-                        )
-                    elif response.status == HTTPStatus.TOO_MANY_REQUESTS:
-                        error = NotionTodoApiClientRateLimitError(ERROR_RATE_LIMIT)
-                    else:
+        """Make an API request, retrying rate limited and server errors."""
+        headers = self._get_headers if method is HTTPMethod.GET else self._post_headers
+        body = orjson.dumps(data) if data is not None else None
+        for attempt in range(MAX_ATTEMPTS):
+            error: NotionTodoApiClientError | None = None
+            try:
+                async with (
+                    self._request_slots,
+                    self._session.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        data=body,
+                        timeout=REQUEST_TIMEOUT,
+                    ) as response,
+                ):
+                    error, retry_delay = _response_error(response, attempt)
+                    if error is None:
                         response.raise_for_status()
-                        return await response.json()
-
-        except TimeoutError as exception:
-            msg = f"Timeout error fetching information - {exception}"
-            raise NotionTodoApiClientCommunicationError(msg) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
-            msg = f"Error fetching information - {exception}"
-            raise NotionTodoApiClientCommunicationError(msg) from exception
-        except NotionTodoApiClientError:
-            raise
-        except Exception as exception:  # pylint: disable=broad-except
-            msg = f"Unexpected error - {exception}"
-            raise NotionTodoApiClientError(msg) from exception
+                        return orjson.loads(await response.read())
+
+            except TimeoutError as exception:
+                msg = f"Timeout error fetching information - {exception}"
+                raise NotionTodoApiClientCommunicationError(msg) from exception
+            except (aiohttp.ClientError, socket.gaierror) as exception:
+                msg = f"Error fetching information - {exception}"
+                raise NotionTodoApiClientCommunicationError(msg) from exception
+            except orjson.JSONDecodeError as exception:
+                msg = f"{ERROR_UNEXPECTED_RESPONSE} - {exception}"
+                raise NotionTodoApiClientError(msg) from exception
+            except NotionTodoApiClientError:
+                raise
+
+            if retry_delay is None or attempt == MAX_ATTEMPTS - 1:
+                break
+            await asyncio.sleep(retry_delay)
 
         if error is not None:
             raise error
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 import uuid
-from typing import Any
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -40,36 +41,72 @@ from .const import (
     LOGGER,
 )
 
+TEXT_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.TEXT)
+)
+PASSWORD_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)
+)
+DAYS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        step=1,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+
+def _dropdown_selector(options: list[dict[str, str]]) -> selector.SelectSelector:
+    """Build a dropdown selector for the given options."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    )
+
 
 def _database_title(database: dict[str, Any]) -> str | None:
     """Extract database title."""
-    title_parts = database.get("title", [])
-    title = "".join(part.get("plain_text", "") for part in title_parts).strip()
+    title_parts = database.get("title") or []
+    if len(title_parts) == 1:
+        title = title_parts[0].get("plain_text", "").strip()
+    else:
+        title = "".join([part.get("plain_text", "") for part in title_parts]).strip()
     return title or None
 
 
-def _data_sources(database: dict[str, Any]) -> list[dict[str, str]]:
+class _DataSource(NamedTuple):
+    """A data source id/name pair."""
+
+    id: str
+    name: str
+
+
+def _data_sources(database: dict[str, Any]) -> list[_DataSource]:
     """Extract data source id/name pairs from a database payload."""
-    sources: list[dict[str, str]] = []
+    sources: list[_DataSource] = []
+    seen: set[str] = set()
     for source in database.get("data_sources") or []:
         source_id = source.get("id")
         if not source_id:
             continue
         sources.append(
-            {
-                "id": source_id,
-                "name": str(source.get("name") or source.get("title") or ""),
-            }
+            _DataSource(
+                id=source_id,
+                name=str(source.get("name") or source.get("title") or ""),
+            )
         )
+        seen.add(source_id)
     if database.get("data_source"):
         source = database.get("data_source") or {}
         source_id = source.get("id")
-        if source_id and not any(s["id"] == source_id for s in sources):
+        if source_id and source_id not in seen:
             sources.append(
-                {
-                    "id": source_id,
-                    "name": str(source.get("name") or source.get("title") or ""),
-                }
+                _DataSource(
+                    id=source_id,
+                    name=str(source.get("name") or source.get("title") or ""),
+                )
             )
     return sources
 
@@ -82,27 +119,32 @@ _UUID_RE = re.compile(
 UNDASHED_UUID_LENGTH = 32
 
 
+def _dash_uuid(hex32: str) -> str:
+    """Format an undashed 32 character hex id the way uuid.UUID prints it."""
+    hex32 = hex32.lower()
+    return f"{hex32[:8]}-{hex32[8:12]}-{hex32[12:16]}-{hex32[16:20]}-{hex32[20:]}"
+
+
 def _candidate_database_ids(value: str) -> list[str]:
     """Return candidate Notion database ids from a raw id or URL."""
-    matches = _UUID_RE.findall(value)
-    if not matches:
-        return []
-    candidates: list[str] = []
-    for raw in matches:
-        if raw not in candidates:
-            candidates.append(raw)
+    tail = value.rsplit("/", 1)[-1].split("?", 1)[0].split("#", 1)[0]
+    try:
+        parsed = uuid.UUID(tail)
+    except ValueError:
+        pass
+    else:
+        return [str(parsed), parsed.hex]
+    candidates: dict[str, None] = {}
+    for match in _UUID_RE.finditer(value):
+        raw = match.group(0)
+        candidates.setdefault(raw, None)
         if "-" not in raw and len(raw) == UNDASHED_UUID_LENGTH:
-            try:
-                dashed = str(uuid.UUID(hex=raw))
-            except ValueError:
-                dashed = None
-            if dashed and dashed not in candidates:
-                candidates.append(dashed)
+            candidates.setdefault(_dash_uuid(raw), None)
         elif "-" in raw:
             stripped = raw.replace("-", "")
-            if stripped and stripped not in candidates:
-                candidates.append(stripped)
-    return candidates
+            if stripped:
+                candidates.setdefault(stripped, None)
+    return list(candidates)
 
 
 class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -113,9 +155,11 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize config flow."""
         self._pending_data: dict[str, Any] | None = None
-        self._available_databases: list[dict[str, str]] | None = None
-        self._available_data_sources: list[dict[str, str]] | None = None
+        self._available_databases: list[dict[str, Any]] | None = None
+        self._available_data_sources: list[_DataSource] | None = None
         self._pending_database_title: str | None = None
+        self._client: NotionTodoApiClient | None = None
+        self._client_token: str | None = None
         super().__init__()
 
     @staticmethod
@@ -125,6 +169,16 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return NotionTodoOptionsFlowHandler(config_entry)
 
+    def _get_client(self, token: str) -> NotionTodoApiClient:
+        """Return the flow's API client, rebuilding it if the token changed."""
+        if self._client is None or self._client_token != token:
+            self._client = NotionTodoApiClient(
+                token=token,
+                session=async_get_clientsession(self.hass),
+            )
+            self._client_token = token
+        return self._client
+
     def _errors_from_exception(
         self, exception: NotionTodoApiClientError
     ) -> dict[str, str]:
@@ -159,91 +213,53 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_TOKEN,
                         default=(user_input or {}).get(CONF_TOKEN, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.PASSWORD,
-                        ),
-                    ),
+                    ): PASSWORD_SELECTOR,
                     vol.Required(
                         CONF_DATABASE_ID,
                         default=(user_input or {}).get(CONF_DATABASE_ID, vol.UNDEFINED),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_TITLE_PROPERTY,
                         default=(user_input or {}).get(
                             CONF_TITLE_PROPERTY, DEFAULT_TITLE_PROPERTY
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_STATUS_PROPERTY,
                         default=(user_input or {}).get(
                             CONF_STATUS_PROPERTY, DEFAULT_STATUS_PROPERTY
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_DUE_PROPERTY,
                         default=(user_input or {}).get(
                             CONF_DUE_PROPERTY, DEFAULT_DUE_PROPERTY
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_DESCRIPTION_PROPERTY,
                         default=(user_input or {}).get(
                             CONF_DESCRIPTION_PROPERTY, DEFAULT_DESCRIPTION_PROPERTY
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_INCLUDE_STATUSES,
                         default=(user_input or {}).get(
                             CONF_INCLUDE_STATUSES, DEFAULT_INCLUDE_STATUSES
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_EXCLUDE_STATUSES,
                         default=(user_input or {}).get(
                             CONF_EXCLUDE_STATUSES, DEFAULT_EXCLUDE_STATUSES
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_DUE_WITHIN_DAYS,
                         default=(user_input or {}).get(
                             CONF_DUE_WITHIN_DAYS, DEFAULT_DUE_WITHIN_DAYS
                         ),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            step=1,
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
+                    ): DAYS_SELECTOR,
                 },
             ),
             errors=errors,
@@ -252,22 +268,36 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     async def _async_find_database(
         self, client: NotionTodoApiClient, candidates: list[str]
     ) -> tuple[dict[str, Any] | None, str | None]:
-        database: dict[str, Any] | None = None
-        selected_id: str | None = None
-        for candidate_id in candidates:
-            try:
-                database = await client.async_get_database(candidate_id)
-            except NotionTodoApiClientNotFoundError as exception:
-                LOGGER.warning(
-                    "Database not found for %s: %s",
-                    candidate_id,
-                    exception,
-                )
-                continue
-            else:
-                selected_id = candidate_id
-                break
-        return database, selected_id
+        # The first candidate nearly always matches, so probe it alone and
+        # only fan out to the others when it is not found.
+        first, *rest = candidates
+        try:
+            return await client.async_get_database(first), first
+        except NotionTodoApiClientNotFoundError as exception:
+            LOGGER.warning("Database not found for %s: %s", first, exception)
+
+        # Probe the remaining candidates at once, preferring input order.
+        probes = [
+            asyncio.create_task(client.async_get_database(candidate_id))
+            for candidate_id in rest
+        ]
+        try:
+            for candidate_id, probe in zip(rest, probes, strict=True):
+                try:
+                    database = await probe
+                except NotionTodoApiClientNotFoundError as exception:
+                    LOGGER.warning(
+                        "Database not found for %s: %s",
+                        candidate_id,
+                        exception,
+                    )
+                    continue
+                return database, candidate_id
+        finally:
+            for probe in probes:
+                probe.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
+        return None, None
 
     async def _async_handle_database_list(
         self, client: NotionTodoApiClient, user_input: dict[str, Any]
@@ -291,25 +321,31 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         sources = _data_sources(database)
         if not sources:
             return {"base": "invalid_database"}
+        return await self._async_handle_data_sources(
+            user_input, database, selected_id, sources
+        )
+
+    async def _async_handle_data_sources(
+        self,
+        data: dict[str, Any],
+        database: dict[str, Any],
+        selected_id: str,
+        sources: list[_DataSource],
+    ) -> config_entries.ConfigFlowResult:
+        """Create the entry for a single data source, otherwise ask for one."""
+        selected_data = data | {CONF_DATABASE_ID: selected_id}
+        title = _database_title(database) or selected_id
         if len(sources) == 1:
-            user_input = {
-                **user_input,
-                CONF_DATABASE_ID: selected_id,
-                CONF_DATA_SOURCE_ID: sources[0]["id"],
-            }
-            await self.async_set_unique_id(sources[0]["id"])
+            await self.async_set_unique_id(sources[0].id)
             self._abort_if_unique_id_configured()
             return self.async_create_entry(
-                title=_database_title(database) or selected_id,
-                data=user_input,
+                title=title,
+                data=selected_data | {CONF_DATA_SOURCE_ID: sources[0].id},
             )
 
-        self._pending_data = {
-            **user_input,
-            CONF_DATABASE_ID: selected_id,
-        }
+        self._pending_data = selected_data
         self._available_data_sources = sources
-        self._pending_database_title = _database_title(database) or selected_id
+        self._pending_database_title = title
         return await self.async_step_select_data_source()
 
     async def _async_handle_user_input(
@@ -319,10 +355,7 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         if not candidates:
             return {"base": "invalid_id"}
 
-        client = NotionTodoApiClient(
-            token=user_input[CONF_TOKEN],
-            session=async_get_clientsession(self.hass),
-        )
+        client = self._get_client(user_input[CONF_TOKEN])
         try:
             database, selected_id = await self._async_find_database(client, candidates)
         except NotionTodoApiClientError as exception:
@@ -358,7 +391,7 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             options = [
                 {
                     "value": item["id"],
-                    "label": item["title"] or item["id"],
+                    "label": _database_title(item) or item["id"],
                 }
                 for item in self._available_databases
             ]
@@ -366,49 +399,30 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 step_id="select",
                 data_schema=vol.Schema(
                     {
-                        vol.Required(CONF_DATABASE_ID): selector.SelectSelector(
-                            selector.SelectSelectorConfig(
-                                options=options,
-                                mode=selector.SelectSelectorMode.DROPDOWN,
-                            )
-                        ),
+                        vol.Required(CONF_DATABASE_ID): _dropdown_selector(options),
                     }
                 ),
             )
 
         selected = user_input[CONF_DATABASE_ID]
-        client = NotionTodoApiClient(
-            token=self._pending_data[CONF_TOKEN],
-            session=async_get_clientsession(self.hass),
+        database = next(
+            (item for item in self._available_databases if item["id"] == selected),
+            {},
         )
-        try:
-            database = await client.async_get_database(selected)
-        except NotionTodoApiClientError as exception:
-            return self._abort_from_exception(exception)
-
         sources = _data_sources(database)
+        if not sources:
+            # Search results may omit data sources; fetch the database itself.
+            client = self._get_client(self._pending_data[CONF_TOKEN])
+            try:
+                database = await client.async_get_database(selected)
+            except NotionTodoApiClientError as exception:
+                return self._abort_from_exception(exception)
+            sources = _data_sources(database)
         if not sources:
             return self.async_abort(reason="invalid_database")
-        if len(sources) == 1:
-            data = {
-                **self._pending_data,
-                CONF_DATABASE_ID: selected,
-                CONF_DATA_SOURCE_ID: sources[0]["id"],
-            }
-            await self.async_set_unique_id(sources[0]["id"])
-            self._abort_if_unique_id_configured()
-            return self.async_create_entry(
-                title=_database_title(database) or selected,
-                data=data,
-            )
-
-        self._pending_data = {
-            **self._pending_data,
-            CONF_DATABASE_ID: selected,
-        }
-        self._available_data_sources = sources
-        self._pending_database_title = _database_title(database) or selected
-        return await self.async_step_select_data_source()
+        return await self._async_handle_data_sources(
+            self._pending_data, database, selected, sources
+        )
 
     async def async_step_select_data_source(
         self, user_input: dict[str, Any] | None = None
@@ -419,10 +433,7 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             selected = user_input[CONF_DATA_SOURCE_ID]
-            data = {
-                **self._pending_data,
-                CONF_DATA_SOURCE_ID: selected,
-            }
+            data = self._pending_data | {CONF_DATA_SOURCE_ID: selected}
             await self.async_set_unique_id(selected)
             self._abort_if_unique_id_configured()
             return self.async_create_entry(
@@ -432,8 +443,8 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         options = [
             {
-                "value": item["id"],
-                "label": item["name"] or item["id"],
+                "value": item.id,
+                "label": item.name or item.id,
             }
             for item in self._available_data_sources
         ]
@@ -441,31 +452,18 @@ class NotionTodoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="select_data_source",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_DATA_SOURCE_ID): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=options,
-                            mode=selector.SelectSelectorMode.DROPDOWN,
-                        )
-                    ),
+                    vol.Required(CONF_DATA_SOURCE_ID): _dropdown_selector(options),
                 }
             ),
         )
 
 
-async def _list_databases(client: NotionTodoApiClient) -> list[dict[str, str]]:
-    """Return accessible databases as id/title pairs."""
+async def _list_databases(client: NotionTodoApiClient) -> list[dict[str, Any]]:
+    """Return accessible database payloads."""
     results = await client.async_search_databases()
-    databases: list[dict[str, str]] = []
-    for item in results:
-        if item.get("object") != "database":
-            continue
-        databases.append(
-            {
-                "id": item.get("id", ""),
-                "title": _database_title(item) or "",
-            }
-        )
-    return [db for db in databases if db["id"]]
+    return [
+        item for item in results if item.get("object") == "database" and item.get("id")
+    ]
 
 
 class NotionTodoOptionsFlowHandler(config_entries.OptionsFlow):
@@ -494,35 +492,21 @@ class NotionTodoOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_INCLUDE_STATUSES,
                             data.get(CONF_INCLUDE_STATUSES, DEFAULT_INCLUDE_STATUSES),
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_EXCLUDE_STATUSES,
                         default=options.get(
                             CONF_EXCLUDE_STATUSES,
                             data.get(CONF_EXCLUDE_STATUSES, DEFAULT_EXCLUDE_STATUSES),
                         ),
-                    ): selector.TextSelector(
-                        selector.TextSelectorConfig(
-                            type=selector.TextSelectorType.TEXT,
-                        ),
-                    ),
+                    ): TEXT_SELECTOR,
                     vol.Optional(
                         CONF_DUE_WITHIN_DAYS,
                         default=options.get(
                             CONF_DUE_WITHIN_DAYS,
                             data.get(CONF_DUE_WITHIN_DAYS, DEFAULT_DUE_WITHIN_DAYS),
                         ),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            step=1,
-                            mode=selector.NumberSelectorMode.BOX,
-                        )
-                    ),
+                    ): DAYS_SELECTOR,
                 }
             ),
         )
@@ -11,15 +11,37 @@ from .api import (
     NotionTodoApiClientAuthenticationError,
     NotionTodoApiClientError,
     NotionTodoApiClientNotFoundError,
+    NotionTodoApiClientRateLimitError,
+)
+from .const import (
+    CONF_DATA_SOURCE_ID,
+    CONF_DESCRIPTION_PROPERTY,
+    CONF_DUE_PROPERTY,
+    CONF_STATUS_PROPERTY,
+    CONF_TITLE_PROPERTY,
+    DEFAULT_DESCRIPTION_PROPERTY,
+    DEFAULT_DUE_PROPERTY,
+    DEFAULT_STATUS_PROPERTY,
+    DEFAULT_TITLE_PROPERTY,
 )
-from .const import CONF_DATA_SOURCE_ID
 
 MISSING_DATA_SOURCE_ID_MESSAGE = "Missing data source id; reconfigure integration."
+PAGE_FIELDS = ("id", "last_edited_time")
 
 if TYPE_CHECKING:
     from .data import NotionTodoConfigEntry
 
 
+def _slim_page(page: dict[str, Any], property_names: set[str]) -> dict[str, Any]:
+    """Keep only the page fields and properties the todo list reads."""
+    properties = page.get("properties") or {}
+    slim = {key: page[key] for key in PAGE_FIELDS if key in page}
+    slim["properties"] = {
+        name: properties[name] for name in property_names if name in properties
+    }
+    return slim
+
+
 class NotionTodoDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     """Class to manage fetching data from the API."""
 
@@ -27,17 +49,36 @@ class NotionTodoDataUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]
 
     async def _async_update_data(self) -> list[dict[str, Any]]:
         """Update data via API."""
+        # Pages carry every database property; retain only what is displayed.
+        property_names = {
+            self.config_entry.data.get(CONF_TITLE_PROPERTY, DEFAULT_TITLE_PROPERTY),
+            self.config_entry.data.get(CONF_STATUS_PROPERTY, DEFAULT_STATUS_PROPERTY),
+            self.config_entry.data.get(CONF_DUE_PROPERTY, DEFAULT_DUE_PROPERTY),
+            self.config_entry.data.get(
+                CONF_DESCRIPTION_PROPERTY, DEFAULT_DESCRIPTION_PROPERTY
+            ),
+        }
         try:
             data_source_id = self.config_entry.data.get(CONF_DATA_SOURCE_ID)
             if not data_source_id:
                 msg = MISSING_DATA_SOURCE_ID_MESSAGE
                 raise UpdateFailed(msg)
-            return await self.config_entry.runtime_data.client.async_query_data_source(
-                data_source_id
-            )
+            client = self.config_entry.runtime_data.client
+            # Archived and trashed pages are dropped here so the todo list
+            # never sees them.
+            return [
+                _slim_page(page, property_names)
+                async for page in client.async_iter_query_data_source(data_source_id)
+                if not (page.get("archived") or page.get("in_trash"))
+            ]
         except NotionTodoApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except NotionTodoApiClientNotFoundError as exception:
             raise UpdateFailed(exception) from exception
+        except NotionTodoApiClientRateLimitError as exception:
+            if self.data is None:
+                raise UpdateFailed(exception) from exception
+            self.logger.warning("Keeping last known tasks: %s", exception)
+            return self.data
         except NotionTodoApiClientError as exception:
             raise UpdateFailed(exception) from exception
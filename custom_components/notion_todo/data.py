@@ -16,7 +16,7 @@ if TYPE_CHECKING:
 type NotionTodoConfigEntry = ConfigEntry[NotionTodoData]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotionTodoData:
     """Data for the Notion Todo integration."""
 
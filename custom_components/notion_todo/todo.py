@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import TYPE_CHECKING, Any
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from homeassistant.components.todo import TodoItem, TodoItemStatus, TodoListEntity
 from homeassistant.core import callback
@@ -35,6 +37,25 @@ if TYPE_CHECKING:
 
     from .data import NotionTodoConfigEntry
 
+# Notion truncates last_edited_time to the minute, so a page edited again
+# within that minute keeps its timestamp. Only cache pages whose edit minute
+# is safely in the past.
+CACHE_SETTLE_TIME = dt.timedelta(minutes=2)
+# Some changes alter a built item without touching the page's
+# last_edited_time: renaming a status or select option, renaming a page
+# mentioned in rich text, or changing Home Assistant's time zone. The cache
+# is dropped periodically so such items are rebuilt within this bound.
+CACHE_MAX_AGE = dt.timedelta(hours=1)
+EDITED_MINUTE_FORMAT = "%Y-%m-%dT%H:%M"
+ISO_DATE_LENGTH = len("YYYY-MM-DD")
+
+_COMPLETED_RE = re.compile(r"done|complete|dropped")
+_MISSING = object()
+
+# Cached per page id: last_edited_time, extracted status, and the built item
+# (None while the page is excluded by status).
+_CachedItem = tuple[str, tuple[str | None, bool], TodoItem | None]
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -48,7 +69,9 @@ async def async_setup_entry(
 
 def _plain_text(parts: list[dict[str, Any]]) -> str:
     """Join Notion rich text parts into a string."""
-    return "".join(part.get("plain_text", "") for part in parts).strip()
+    if len(parts) == 1:
+        return parts[0].get("plain_text", "").strip()
+    return "".join([part.get("plain_text", "") for part in parts]).strip()
 
 
 def _extract_text(prop: dict[str, Any] | None) -> str | None:
@@ -75,64 +98,153 @@ def _extract_due(prop: dict[str, Any] | None) -> dt.date | dt.datetime | None:
     if "T" in start:
         parsed = dt_util.parse_datetime(start)
         return dt_util.as_local(parsed) if parsed else None
+    if len(start) != ISO_DATE_LENGTH or start[4] != "-" or start[7] != "-":
+        return None
     try:
         return dt.date.fromisoformat(start)
     except ValueError:
         return None
 
 
-def _status_name(prop: dict[str, Any] | None) -> str | None:
-    """Extract status/select name from a Notion property."""
-    if not prop:
-        return None
-    prop_type = prop.get("type")
-    if prop_type in ("status", "select"):
-        value = prop.get(prop_type) or {}
-        return value.get("name")
-    return None
+@lru_cache(maxsize=256)
+def _is_completed_name(status_cf: str | None) -> bool:
+    """Determine completion based on a casefolded status name."""
+    return status_cf is not None and _COMPLETED_RE.search(status_cf) is not None
 
 
-def _is_completed(prop: dict[str, Any] | None) -> bool:
-    """Determine completion based on a Notion property."""
+def _status(prop: dict[str, Any] | None) -> tuple[str | None, bool]:
+    """Extract the casefolded status name and completion from a property."""
     if not prop:
-        return False
+        return None, False
     prop_type = prop.get("type")
     if prop_type == "checkbox":
-        return bool(prop.get("checkbox"))
+        return None, bool(prop.get("checkbox"))
     if prop_type in ("status", "select"):
-        value = prop.get(prop_type) or {}
-        name = (value.get("name") or "").casefold()
-        return (
-            "done" in name
-            or "complete" in name
-            or "completed" in name
-            or "dropped" in name
-        )
-    return False
+        try:
+            name = prop[prop_type]["name"]
+        except (KeyError, TypeError):
+            return None, False
+        status_cf = name.casefold() if name else None
+        return status_cf, _is_completed_name(status_cf)
+    return None, False
+
+
+def _build_item(
+    page: dict[str, Any],
+    status: tuple[str | None, bool],
+    title_key: str,
+    due_key: str,
+    description_key: str,
+) -> TodoItem:
+    """Build the todo item for a page whose status is already extracted."""
+    props = page.get("properties", {})
+    return TodoItem(
+        summary=_extract_text(props.get(title_key)) or "Untitled",
+        uid=page.get("id"),
+        status=TodoItemStatus.COMPLETED if status[1] else TodoItemStatus.NEEDS_ACTION,
+        due=_extract_due(props.get(due_key)),
+        description=_extract_text(props.get(description_key)) or None,
+    )
 
 
-def _parse_status_list(value: str | None) -> set[str]:
+def _parse_status_list(value: str | None) -> frozenset[str]:
     """Parse a comma-separated list of statuses."""
     if not value:
-        return set()
-    return {item.strip().casefold() for item in value.split(",") if item.strip()}
+        return frozenset()
+    return frozenset(
+        item.strip().casefold() for item in value.split(",") if item.strip()
+    )
 
 
 def _get_entry_value(entry: NotionTodoConfigEntry, key: str, default: Any) -> Any:
     """Return config value from options or data."""
-    if key in entry.options:
-        return entry.options.get(key, default)
+    value = entry.options.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
     return entry.data.get(key, default)
 
 
-def _due_within_window(due: dt.date | dt.datetime | None, days: int) -> bool:
-    """Check if due is within the next N days."""
-    if due is None or days <= 0:
+def _due_cutoff(days: int) -> dt.datetime | None:
+    """Return the end of the next N days, or None when there is no window."""
+    if days <= 0:
+        return None
+    return dt_util.now() + dt.timedelta(days=days)
+
+
+def _due_within_window(
+    due: dt.date | dt.datetime | None,
+    cutoff: dt.datetime | None,
+    date_cutoff: dt.date | None,
+) -> bool:
+    """Check if due falls on or before the precomputed window cutoffs."""
+    if due is None or cutoff is None or date_cutoff is None:
         return False
-    now = dt_util.now()
     if isinstance(due, dt.datetime):
-        return due <= now + dt.timedelta(days=days)
-    return due <= (now.date() + dt.timedelta(days=days))
+        return due <= cutoff
+    return due <= date_cutoff
+
+
+class _ListSettings(NamedTuple):
+    """Property names and parsed filters for a todo list."""
+
+    title_property: str
+    status_property: str
+    due_property: str
+    description_property: str
+    include_statuses: frozenset[str]
+    exclude_statuses: frozenset[str]
+    due_within_days: int
+
+
+def _build_items(
+    pages: list[dict[str, Any]],
+    previous_cache: dict[str, _CachedItem],
+    settings: _ListSettings,
+) -> tuple[list[TodoItem], dict[str, _CachedItem]]:
+    """
+    Build the filtered todo items for a list of pages.
+
+    Returns the items together with the cache to pass in on the next call.
+    """
+    title_key = settings.title_property
+    status_key = settings.status_property
+    due_key = settings.due_property
+    description_key = settings.description_property
+    include_statuses = settings.include_statuses
+    exclude_statuses = settings.exclude_statuses
+    due_within_days = settings.due_within_days
+    due_cutoff = _due_cutoff(due_within_days)
+    due_date_cutoff = due_cutoff.date() if due_cutoff else None
+    settled = (dt_util.utcnow() - CACHE_SETTLE_TIME).strftime(EDITED_MINUTE_FORMAT)
+    filter_by_inclusion = bool(include_statuses) or due_within_days > 0
+    item_cache: dict[str, _CachedItem] = {}
+    items: list[TodoItem] = []
+    items_append = items.append
+    for page in pages:
+        page_id = page.get("id")
+        edited = page.get("last_edited_time") or ""
+        cached = previous_cache.get(page_id) if page_id else None
+        if cached is not None and cached[0] == edited:
+            _, status, item = cached
+        else:
+            status = _status(page.get("properties", {}).get(status_key))
+            item = None
+        status_cf = status[0]
+        # Pages excluded by status are never fully parsed.
+        excluded = status_cf in exclude_statuses
+        if item is None and not excluded:
+            item = _build_item(page, status, title_key, due_key, description_key)
+        if page_id and edited and edited < settled:
+            item_cache[page_id] = (edited, status, item)
+        if excluded or item is None:
+            continue
+        if filter_by_inclusion and not (
+            status_cf in include_statuses
+            or _due_within_window(item.due, due_cutoff, due_date_cutoff)
+        ):
+            continue
+        items_append(item)
+    return items, item_cache
 
 
 class NotionTodoListEntity(
@@ -151,84 +263,57 @@ class NotionTodoListEntity(
         super().__init__(coordinator)
         self._entry = entry
         self._database_id = entry.data[CONF_DATABASE_ID]
-        self._title_property = entry.data.get(
-            CONF_TITLE_PROPERTY, DEFAULT_TITLE_PROPERTY
-        )
-        self._status_property = entry.data.get(
-            CONF_STATUS_PROPERTY, DEFAULT_STATUS_PROPERTY
-        )
-        self._due_property = entry.data.get(CONF_DUE_PROPERTY, DEFAULT_DUE_PROPERTY)
-        self._description_property = entry.data.get(
-            CONF_DESCRIPTION_PROPERTY, DEFAULT_DESCRIPTION_PROPERTY
-        )
-        self._include_statuses = _parse_status_list(
-            _get_entry_value(entry, CONF_INCLUDE_STATUSES, DEFAULT_INCLUDE_STATUSES)
-        )
-        self._exclude_statuses = _parse_status_list(
-            _get_entry_value(entry, CONF_EXCLUDE_STATUSES, DEFAULT_EXCLUDE_STATUSES)
-        )
-        self._due_within_days = int(
-            _get_entry_value(entry, CONF_DUE_WITHIN_DAYS, DEFAULT_DUE_WITHIN_DAYS) or 0
+        # Options updates reload the entry, so the filters are fixed for the
+        # lifetime of the entity and parsed only once.
+        self._settings = _ListSettings(
+            title_property=entry.data.get(CONF_TITLE_PROPERTY, DEFAULT_TITLE_PROPERTY),
+            status_property=entry.data.get(
+                CONF_STATUS_PROPERTY, DEFAULT_STATUS_PROPERTY
+            ),
+            due_property=entry.data.get(CONF_DUE_PROPERTY, DEFAULT_DUE_PROPERTY),
+            description_property=entry.data.get(
+                CONF_DESCRIPTION_PROPERTY, DEFAULT_DESCRIPTION_PROPERTY
+            ),
+            include_statuses=_parse_status_list(
+                _get_entry_value(entry, CONF_INCLUDE_STATUSES, DEFAULT_INCLUDE_STATUSES)
+            ),
+            exclude_statuses=_parse_status_list(
+                _get_entry_value(entry, CONF_EXCLUDE_STATUSES, DEFAULT_EXCLUDE_STATUSES)
+            ),
+            due_within_days=int(
+                _get_entry_value(entry, CONF_DUE_WITHIN_DAYS, DEFAULT_DUE_WITHIN_DAYS)
+                or 0
+            ),
         )
+        self._item_cache: dict[str, _CachedItem] = {}
+        self._item_cache_started = dt_util.utcnow()
+        self._last_pages: list[dict[str, Any]] | None = None
+        self._written_available: bool | None = None
         self._attr_unique_id = f"{entry.entry_id}-{self._database_id}"
         self._attr_name = entry.title
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._include_statuses = _parse_status_list(
-            _get_entry_value(
-                self._entry, CONF_INCLUDE_STATUSES, DEFAULT_INCLUDE_STATUSES
-            )
-        )
-        self._exclude_statuses = _parse_status_list(
-            _get_entry_value(
-                self._entry, CONF_EXCLUDE_STATUSES, DEFAULT_EXCLUDE_STATUSES
-            )
-        )
-        self._due_within_days = int(
-            _get_entry_value(self._entry, CONF_DUE_WITHIN_DAYS, DEFAULT_DUE_WITHIN_DAYS)
-            or 0
-        )
         pages = self.coordinator.data or []
-        items: list[TodoItem] = []
-        for page in pages:
-            if page.get("archived") or page.get("in_trash"):
-                continue
-            props = page.get("properties", {})
-            title = _extract_text(props.get(self._title_property)) or "Untitled"
-            status_name = _status_name(props.get(self._status_property))
-            completed = _is_completed(props.get(self._status_property))
-            status = (
-                TodoItemStatus.COMPLETED if completed else TodoItemStatus.NEEDS_ACTION
-            )
-            due = _extract_due(props.get(self._due_property))
-            description = _extract_text(props.get(self._description_property))
-            if (
-                self._exclude_statuses
-                and status_name
-                and status_name.casefold() in self._exclude_statuses
-            ):
-                continue
-            if self._include_statuses or self._due_within_days > 0:
-                include_by_status = (
-                    status_name.casefold() in self._include_statuses
-                    if status_name and self._include_statuses
-                    else False
-                )
-                include_by_due = _due_within_window(due, self._due_within_days)
-                if not (include_by_status or include_by_due):
-                    continue
-            items.append(
-                TodoItem(
-                    summary=title,
-                    uid=page.get("id"),
-                    status=status,
-                    due=due,
-                    description=description or None,
-                )
+        items = self._attr_todo_items
+        # The coordinator hands back the same list when it kept the last known
+        # tasks; nothing to rebuild unless the due window moves with time.
+        if pages is not self._last_pages or self._settings.due_within_days > 0:
+            self._last_pages = pages
+            now = dt_util.utcnow()
+            if now - self._item_cache_started >= CACHE_MAX_AGE:
+                self._item_cache = {}
+                self._item_cache_started = now
+            items, self._item_cache = _build_items(
+                pages, self._item_cache, self._settings
             )
+        # Skip the state write when neither the items nor availability changed.
+        available = self.available
+        if items == self._attr_todo_items and available == self._written_available:
+            return
         self._attr_todo_items = items
+        self._written_available = available
         super()._handle_coordinator_update()
 
     async def async_added_to_hass(self) -> None: